@@ -6,10 +6,10 @@ To contact me: thomas@katagames.io
 PMDI stands for: Py-Multiple Dependency Injection.
 This module defines the *core primitives* of the PMDI pattern:
 
-- CustomizableCode: abstract base class that knows how to instantiate
-  multiple dependencies in one go (via instantiate_dependencies).
+- CustomizableCode: base class ("abstract until wired") that knows how to
+  instantiate multiple dependencies in one go (via instantiate_dependencies).
 
-- wire_dependencies: function that creates a *new concrete subclass*
+- wire_dependencies: function that creates a *concrete subclass*
   with all required dependencies wired.
 
 Mini-guide:
@@ -33,9 +33,18 @@ Mini-guide:
 This keeps a clean separation between *what* a component needs(expressed in the Base cls)
 and *how* those needs are fulfilled (expressed in the wiring step).
 """
-from abc import ABC
-import re
-from typing import Optional, Dict, Any, Set, Type
+import functools
+import keyword
+import types
+from typing import Optional, Callable, Dict, Any, FrozenSet, Mapping, Set, Tuple, Type
+
+# Suffix expected on every keyword passed to instantiate_dependencies
+_SUFFIX = "_kwargs"
+_SUFFIX_LEN = len(_SUFFIX)
+
+# Code objects of generated instantiate_dependencies, keyed by the sorted
+# tuple of required dependency names (i.e. by the "shape" of a wiring)
+_INSTANTIATE_CODE_CACHE: Dict[Tuple[str, ...], types.CodeType] = {}
 
 
 def _extract_prefix_before_kwargs(kwargs_name: str) -> Optional[str]:
@@ -48,13 +57,12 @@ def _extract_prefix_before_kwargs(kwargs_name: str) -> Optional[str]:
     If the name does not follow the "<name>_kwargs" convention,
     None is returned and an error will be raised by the caller.
     """
-    match = re.match(r"(.+)_kwargs$", kwargs_name)
-    if match:
-        return match.group(1)
+    if kwargs_name.endswith(_SUFFIX) and len(kwargs_name) > _SUFFIX_LEN:
+        return kwargs_name[:-_SUFFIX_LEN]
     return None  # Return None if it doesn't match the expected pattern
 
 
-class CustomizableCode(ABC):
+class CustomizableCode:
     """
     Base class for PMDI-enabled components.
 
@@ -78,32 +86,65 @@ class CustomizableCode(ABC):
     ------------------
     CustomizableCode also enforces that a subclass with non-empty
     required_dependencies *cannot* be instantiated unless it has been
-    wired with wire_dependencies(...). This is done via __new__.
+    wired with wire_dependencies(...). The check is computed once in
+    __init_subclass__ (and by wire_dependencies); __new__ only reads the
+    resulting __pmdi_wired__ flag. Only a class flagged as *not* wired is
+    re-checked (before raising), so assigning declared_dependencies on it
+    later on is honoured. A wired class has its dependencies frozen: the
+    plan used by instantiate_dependencies is computed once, and
+    wire_dependencies stores declared_dependencies as a read-only mapping.
+
+    CustomizableCode is *not* an ABC: @abstractmethod is only enforced if
+    the subclass also inherits from abc.ABC (directly or through another
+    ABC, like EngineBase does with AbstractEngine in the showcase).
     """
 
+    # No per-instance __dict__ here; wired subclasses get one slot per dependency
+    __slots__ = ()
+
     # Names of dependencies that MUST be wired at the class level
     required_dependencies: Set[str] = set()
+    # Dependency classes, by name. Filled in by wire_dependencies (or declared
+    # by a subclass itself); the shared default here is read-only.
+    declared_dependencies: Mapping[str, Type] = types.MappingProxyType({})
+
+    # True when every required dependency has been wired (see __init_subclass__)
+    __pmdi_wired__: bool = True
+    # Pre-formatted TypeError message, raised by __new__ when not wired
+    _pmdi_err_unwired: str = ""
+
+    # Wiring plan, precomputed once per wired class: ((name, "<name>_kwargs", dep_class), ...)
+    # for every required dependency, and the set of the matching "<name>_kwargs" keys
+    _pmdi_plan_with_keys: Tuple[Tuple[str, str, Type], ...] = ()
+    _pmdi_required_kw_set: FrozenSet[str] = frozenset()
+    # Pre-formatted RuntimeError message, for missing "<name>_kwargs" keys
+    _pmdi_err_missing_kw: str = "Missing kwargs for dependencies: %s."
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Computes, once per subclass, whether the class is "abstract until wired".
+
+        See _refresh_wiring. Classes produced by wire_dependencies already
+        carry the outcome in their namespace, so nothing is recomputed.
+        """
+        super().__init_subclass__(**kwargs)
+        if "__pmdi_wired__" in cls.__dict__:
+            return  # already provided in the namespace, by wire_dependencies
+        _refresh_wiring(cls)
 
     def __new__(cls, *args, **kwargs):
         """
         Enforces that the class behaves as "abstract until wired".
 
-        If required_dependencies is non-empty, we check that the class
-        has a declared_dependencies dict, and that it contains entries
-        for all required names. If not, a TypeError is raised.
-
         This prevents accidental instantiation of a partially wired class.
+        If the class is flagged as not wired, the check is done again before
+        raising: declared_dependencies may have been assigned on the class
+        after its creation.
         """
-        required = getattr(cls, "required_dependencies", set())
-        if required:
-            declared = getattr(cls, "declared_dependencies", {})
-            missing = set(required) - set(declared.keys())
-            if missing:
-                missing_str = ", ".join(sorted(missing))
-                raise TypeError(
-                    f"Cannot instantiate '{cls.__name__}' – missing wired dependencies: "
-                    f"{missing_str}. Use wire_dependencies({cls.__name__}, ...) first."
-                )
+        if not cls.__pmdi_wired__:
+            _refresh_wiring(cls)
+            if not cls.__pmdi_wired__:
+                raise TypeError(cls._pmdi_err_unwired)
         return super().__new__(cls)
 
     def instantiate_dependencies(self, **kwargs: Dict[str, Any]) -> None:
@@ -129,40 +170,84 @@ class CustomizableCode(ABC):
         to an instance of the corresponding dependency class.
         """
         cls = self.__class__
-        required = getattr(cls, "required_dependencies", set())
+        plan = cls._pmdi_plan_with_keys
+        required_kw_set = cls._pmdi_required_kw_set
 
         # 1) Check that all required deps have a corresponding *_kwargs
-        missing_kwargs = [
-            dep for dep in required
-            if f"{dep}_kwargs" not in kwargs
-        ]
-        if missing_kwargs:
-            missing_str = ", ".join(sorted(missing_kwargs))
-            raise RuntimeError(
-                f"During instantiation of {cls.__name__}, missing kwargs for "
-                f"dependencies: {missing_str}."
-            )
+        missing = required_kw_set - kwargs.keys()
+        if missing:
+            # The plan is sorted by dependency name, so is this list
+            missing_str = ", ".join(name for name, kw_key, _ in plan if kw_key in missing)
+            raise RuntimeError(cls._pmdi_err_missing_kw % missing_str)
+
+        # 2) Instantiate each required dependency, following the wiring plan
+        for infotag, kw_key, dep_class in plan:
+            # Instantiate the dependency and attach it as an attribute on self
+            setattr(self, infotag, dep_class(**kwargs[kw_key]))
 
-        # 2) Instantiate each provided dependency
-        declared = getattr(cls, "declared_dependencies", {})
+        # 3) Instantiate any extra (non-required) dependency that was provided
+        if len(kwargs) > len(required_kw_set):
+            declared = cls.declared_dependencies
 
-        for dep_kw_name, dep_kwargs in kwargs.items():
-            infotag = _extract_prefix_before_kwargs(dep_kw_name)
-            if infotag is None:
-                raise RuntimeError(
-                    f"Dependency kwarg name '{dep_kw_name}' is invalid. Expected a name "
-                    f"like '<dependency>_kwargs'."
-                )
+            for dep_kw_name in sorted(kwargs.keys() - required_kw_set):
+                dep_kwargs = kwargs[dep_kw_name]
+                infotag = _extract_prefix_before_kwargs(dep_kw_name)
+                if infotag is None:
+                    raise RuntimeError(
+                        f"Dependency kwarg name '{dep_kw_name}' is invalid. Expected a name "
+                        f"like '<dependency>_kwargs'."
+                    )
 
-            if infotag not in declared:
-                raise RuntimeError(
-                    f"Dependency '{infotag}' not declared for class '{cls.__name__}'. "
-                    f"Did you forget to wire it with wire_dependencies(...) ?"
-                )
+                if infotag not in declared:
+                    raise RuntimeError(
+                        f"Dependency '{infotag}' not declared for class '{cls.__name__}'. "
+                        f"Did you forget to wire it with wire_dependencies(...) ?"
+                    )
 
-            dep_class = declared[infotag]
-            # Instantiate the dependency and attach it as an attribute on self
-            setattr(self, infotag, dep_class(**dep_kwargs))
+                setattr(self, infotag, declared[infotag](**dep_kwargs))
+
+
+def _refresh_wiring(cls: Type[CustomizableCode]) -> None:
+    """
+    Helper used by CustomizableCode.__init_subclass__ and __new__.
+
+    If required_dependencies is non-empty, we check that the class
+    has a declared_dependencies dict, and that it contains entries
+    for all required names. The outcome is stored in __pmdi_wired__,
+    along with the error message __new__ will raise if it is False.
+
+    A wired class also gets its own plan for instantiate_dependencies,
+    unless the inherited one is already identical.
+    """
+    missing = set(cls.required_dependencies) - set(cls.declared_dependencies.keys())
+    cls.__pmdi_wired__ = not missing
+    if missing:
+        missing_str = ", ".join(sorted(missing))
+        cls._pmdi_err_unwired = (
+            f"Cannot instantiate '{cls.__name__}' – missing wired dependencies: "
+            f"{missing_str}. Use wire_dependencies({cls.__name__}, ...) first."
+        )
+        return
+
+    plan = _make_plan(cls.required_dependencies, cls.declared_dependencies)
+    if plan != cls._pmdi_plan_with_keys:
+        cls._pmdi_plan_with_keys = plan
+        cls._pmdi_required_kw_set = frozenset(kw_key for _, kw_key, _ in plan)
+        cls._pmdi_err_missing_kw = (
+            f"During instantiation of {cls.__name__}, missing kwargs for dependencies: %s."
+        )
+
+
+def _make_plan(required: Set[str], declared: Mapping[str, Type]) -> Tuple[Tuple[str, str, Type], ...]:
+    """
+    Helper building the plan followed by instantiate_dependencies:
+    one (name, "<name>_kwargs", dep_class) triple per required dependency,
+    sorted by name.
+    """
+    return tuple(
+        (dep_name, dep_name + _SUFFIX, declared[dep_name])
+        for dep_name in sorted(required)
+    )
 
 
 def wire_dependencies(base_cls: Type[CustomizableCode], **dependencies: Type) -> Type[CustomizableCode]:
@@ -192,20 +277,25 @@ def wire_dependencies(base_cls: Type[CustomizableCode], **dependencies: Type) ->
         Engine = wire_dependencies(EngineBase, cylinder=CylinderClass)
         engine = Engine()   # OK
         EngineBase()        # TypeError: abstract until wired
-    """
-    # Name of the new concrete class
-    name = base_cls.__name__ + "Wired"
 
-    # Create a new subclass that inherits from base_cls
-    new_cls = type(name, (base_cls,), {})
+    Wiring the same base_cls with the same dependencies again returns the
+    same concrete class (results are cached), as long as every dependency
+    is hashable; otherwise a fresh class is built on each call.
 
-    # Attach declared_dependencies on the new class.
+    Dependency names are lower-cased; passing them already in lowercase
+    (as in required_dependencies) skips that conversion entirely.
+    """
     # We lower-case the keys to be tolerant about naming.
-    new_cls.declared_dependencies = {k.lower(): v for k, v in dependencies.items()}
-
-    # Optional but useful: check that all required deps are now present.
-    required = getattr(base_cls, "required_dependencies", set())
-    missing = set(required) - set(new_cls.declared_dependencies.keys())
+    # dependencies is our own **kwargs dict, so it can be used as-is when
+    # no key needs lowering.
+    if any(k != k.lower() for k in dependencies):
+        declared = {k.lower(): v for k, v in dependencies.items()}
+    else:
+        declared = dependencies
+
+    # Check that all required deps are present. This happens outside the
+    # cache, so incomplete wirings always raise and are never memoized.
+    missing = set(base_cls.required_dependencies) - set(declared.keys())
     if missing:
         missing_str = ", ".join(sorted(missing))
         raise TypeError(
@@ -213,4 +303,129 @@ def wire_dependencies(base_cls: Type[CustomizableCode], **dependencies: Type) ->
             f"{missing_str}"
         )
 
-    return new_cls
+    deps_items = tuple(sorted(declared.items()))
+    try:
+        hash(deps_items)
+    except TypeError:
+        # Some dependency (e.g. a factory instance) is unhashable: build the
+        # class without going through the cache.
+        return _wire_cached.__wrapped__(base_cls, deps_items)
+    return _wire_cached(base_cls, deps_items)
+
+
+@functools.lru_cache(maxsize=None)
+def _wire_cached(base_cls: Type[CustomizableCode], deps_items: Tuple[Tuple[str, Type], ...]) -> Type[CustomizableCode]:
+    """
+    Build the wired subclass of base_cls for the given (name, class) pairs.
+
+    Results are memoized: wiring the same base with the same dependencies
+    twice returns the very same class object, so isinstance checks stay
+    consistent and the type() machinery only runs once per shape.
+    The cache is unbounded on purpose: evicting an entry would break that
+    identity guarantee.
+    """
+    # Name of the new concrete class
+    name = base_cls.__name__ + "Wired"
+
+    declared = dict(deps_items)
+
+    # Precompute the plan followed by instantiate_dependencies
+    plan = _make_plan(base_cls.required_dependencies, declared)
+    required_kw_set = frozenset(kw_key for _, kw_key, _ in plan)
+
+    # The whole namespace is built upfront, so the class is created in one
+    # go instead of being patched (and its method cache invalidated) afterwards.
+    # One slot per dependency attribute. If base_cls (or one of its parents)
+    # does not declare __slots__, instances still carry a __dict__, but the
+    # dependency attributes are stored in slots either way. Names starting
+    # with "__" are left out, as they would be mangled (_XWired__x); those,
+    # like non-identifier names, then need a __dict__ to live in.
+    # Note: non-empty slots mean two wired classes cannot be combined as
+    # bases of a same class (instance lay-out conflict).
+    slots = tuple(
+        n for n in declared
+        if n.isidentifier() and not keyword.iskeyword(n) and not n.startswith("__")
+    )
+    if len(slots) < len(declared) and not base_cls.__dictoffset__:
+        slots += ("__dict__",)
+
+    ns: Dict[str, Any] = {
+        "__slots__": slots,
+        # Read-only: the plan below is built from it, and wired classes are
+        # shared between callers through the cache.
+        "declared_dependencies": types.MappingProxyType(declared),
+        # wire_dependencies already checked completeness, mark the class as wired
+        "__pmdi_wired__": True,
+        "_pmdi_plan_with_keys": plan,
+        "_pmdi_required_kw_set": required_kw_set,
+        "_pmdi_err_missing_kw": f"During instantiation of {name}, missing kwargs for dependencies: %s.",
+    }
+
+    # Replace the generic loop by a specialized, straight-line version, unless
+    # base_cls (or a class above it) overrides instantiate_dependencies: the
+    # user's override must keep running. A method generated for a previous
+    # wiring does not count as an override, its own fallback is used instead.
+    inherited = base_cls.instantiate_dependencies
+    generic = getattr(inherited, "_pmdi_generic", inherited)
+    if (generic is CustomizableCode.instantiate_dependencies
+            and all(n.isidentifier() and not keyword.iskeyword(n) for n, _, _ in plan)):
+        ns["instantiate_dependencies"] = _build_instantiate_dependencies(
+            name, base_cls.__module__, plan, required_kw_set, generic)
+
+    # Create a new subclass that inherits from base_cls
+    return type(name, (base_cls,), ns)
+
+
+def _build_instantiate_dependencies(
+        cls_name: str,
+        module: str,
+        plan: Tuple[Tuple[str, str, Type], ...],
+        required_kw_set: FrozenSet[str],
+        generic: Callable[..., None]) -> Callable[..., None]:
+    """
+    Generate an instantiate_dependencies method specialized for a wired class.
+
+    For a plan like (("cylinder", "cylinder_kwargs", CylinderClass),) the generated body is:
+
+        def instantiate_dependencies(self, **kwargs):
+            if kwargs.keys() != _pmdi_kw_set or self.__class__._pmdi_plan_with_keys is not _pmdi_plan:
+                return _pmdi_generic(self, **kwargs)
+            self.cylinder = _dep_cylinder(**kwargs['cylinder_kwargs'])
+
+    Any call that does not provide exactly the required kwargs, or made on
+    a subclass with a plan of its own, falls back to generic: the method
+    resolved from the base class (which also produces the error messages).
+    Code objects are cached per shape, only the globals (dependency classes)
+    differ between two wirings; their filename is therefore class-neutral.
+    """
+    dep_names = tuple(n for n, _, _ in plan)
+    code = _INSTANTIATE_CODE_CACHE.get(dep_names)
+    if code is None:
+        lines = [
+            "def instantiate_dependencies(self, **kwargs):",
+            "    if kwargs.keys() != _pmdi_kw_set or self.__class__._pmdi_plan_with_keys is not _pmdi_plan:",
+            "        return _pmdi_generic(self, **kwargs)",
+        ]
+        for dep_name, kw_key, _ in plan:
+            lines.append(f"    self.{dep_name} = _dep_{dep_name}(**kwargs[{kw_key!r}])")
+        src = "\n".join(lines) + "\n"
+        ns: Dict[str, Any] = {}
+        exec(compile(src, "<pmdi instantiate_dependencies>", "exec"), ns)
+        code = ns["instantiate_dependencies"].__code__
+        _INSTANTIATE_CODE_CACHE[dep_names] = code
+
+    func_globals: Dict[str, Any] = {
+        "_pmdi_kw_set": required_kw_set,
+        "_pmdi_plan": plan,
+        "_pmdi_generic": generic,
+    }
+    for dep_name, _, dep_class in plan:
+        func_globals[f"_dep_{dep_name}"] = dep_class
+
+    func = types.FunctionType(code, func_globals, "instantiate_dependencies")
+    func.__qualname__ = f"{cls_name}.instantiate_dependencies"
+    func.__module__ = module
+    func.__doc__ = generic.__doc__
+    # Lets a later wiring of a subclass find the method to fall back to
+    func._pmdi_generic = generic
+    return func
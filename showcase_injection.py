@@ -36,6 +36,8 @@ from cd_patterns import CustomizableCode, wire_dependencies
 # Abstract Component Interfaces
 # ------------------------------
 class AbstractBumper(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def protect(self):
         """
@@ -46,6 +48,8 @@ class AbstractBumper(ABC):
 
 
 class AbstractWindshield(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def shield(self):
         """
@@ -56,6 +60,8 @@ class AbstractWindshield(ABC):
 
 
 class AbstractCylinder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def fire(self):
         """
@@ -66,6 +72,8 @@ class AbstractCylinder(ABC):
 
 
 class AbstractEngine(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def start(self):
         """
@@ -87,6 +95,8 @@ class AbstractEngine(ABC):
 # Concrete Implementations of Components
 # ------------------------------
 class BumperClass(AbstractBumper):
+    __slots__ = ("hp",)
+
     def __init__(self, hp: int):
         """
         Initializes the bumper with its hit points (hp).
@@ -101,6 +111,8 @@ class BumperClass(AbstractBumper):
 
 
 class WindshieldClass(AbstractWindshield):
+    __slots__ = ()
+
     def shield(self):
         """
         Simulates the windshield shielding the car.
@@ -109,6 +121,8 @@ class WindshieldClass(AbstractWindshield):
 
 
 class CylinderClass(AbstractCylinder):
+    __slots__ = ()
+
     def fire(self):
         """
         Simulates the cylinder firing (engine combustion).
@@ -131,6 +145,7 @@ class EngineBase(AbstractEngine, CustomizableCode):
     wire_dependencies(...). As long as EngineBase is not wired, it is
     considered abstract and cannot be instantiated.
     """
+    __slots__ = ()
     required_dependencies = {"cylinder"}  # it answers: Which dependencies required for this base class?
 
     def __init__(self, etype, producer_name):
@@ -167,6 +182,7 @@ class CarBase(CustomizableCode):
     The concrete classes for bumper, windshield, and engine will be
     provided later using wire_dependencies(...).
     """
+    __slots__ = ()
     required_dependencies = {"bumper", "windshield", "engine"}
 
     def __init__(self):
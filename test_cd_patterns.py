@@ -0,0 +1,120 @@
+"""
+Tests for the instantiate_dependencies fast path generated by wire_dependencies,
+and for each case where it must fall back to the generic implementation.
+
+Run with: python -m unittest test_cd_patterns
+"""
+import unittest
+
+from cd_patterns import CustomizableCode, wire_dependencies
+
+
+class DepA:
+    def __init__(self, value=None):
+        self.value = value
+
+
+class DepB:
+    pass
+
+
+class PairBase(CustomizableCode):
+    required_dependencies = {"a", "b"}
+
+    def __init__(self, **kwargs):
+        self.instantiate_dependencies(**kwargs)
+
+
+class GeneratedFastPathTest(unittest.TestCase):
+    def test_required_kwargs_only(self):
+        Pair = wire_dependencies(PairBase, a=DepA, b=DepB)
+        self.assertIsNot(Pair.instantiate_dependencies, CustomizableCode.instantiate_dependencies)
+
+        pair = Pair(a_kwargs={"value": 3}, b_kwargs={})
+        self.assertIsInstance(pair.a, DepA)
+        self.assertEqual(pair.a.value, 3)
+        self.assertIsInstance(pair.b, DepB)
+
+
+class UserOverrideTest(unittest.TestCase):
+    def test_override_is_kept(self):
+        calls = []
+
+        class OverrideBase(CustomizableCode):
+            required_dependencies = {"a"}
+
+            def __init__(self):
+                self.instantiate_dependencies(a_kwargs={})
+
+            def instantiate_dependencies(self, **kwargs):
+                calls.append(sorted(kwargs))
+                super().instantiate_dependencies(**kwargs)
+
+        Override = wire_dependencies(OverrideBase, a=DepA)
+        self.assertIs(Override.instantiate_dependencies, OverrideBase.instantiate_dependencies)
+
+        obj = Override()
+        self.assertEqual(calls, [["a_kwargs"]])
+        self.assertIsInstance(obj.a, DepA)
+
+
+class SubclassWithOwnPlanTest(unittest.TestCase):
+    def setUp(self):
+        Pair = wire_dependencies(PairBase, a=DepA, b=DepB)
+
+        class Triple(Pair):
+            required_dependencies = {"a", "b", "c"}
+            declared_dependencies = dict(Pair.declared_dependencies, c=DepB)
+
+        self.Triple = Triple
+
+    def test_missing_kwargs_of_new_dependency(self):
+        with self.assertRaises(RuntimeError) as cm:
+            self.Triple(a_kwargs={}, b_kwargs={})
+        self.assertEqual(
+            str(cm.exception),
+            "During instantiation of Triple, missing kwargs for dependencies: c.",
+        )
+
+    def test_new_dependency_is_built(self):
+        triple = self.Triple(a_kwargs={}, b_kwargs={}, c_kwargs={})
+        self.assertIsInstance(triple.a, DepA)
+        self.assertIsInstance(triple.c, DepB)
+
+
+class ExtraOrUnknownKwargsTest(unittest.TestCase):
+    def setUp(self):
+        self.Pair = wire_dependencies(PairBase, a=DepA, b=DepB, c=DepB)
+
+    def test_declared_extra_dependency_is_built(self):
+        pair = self.Pair(a_kwargs={}, b_kwargs={}, c_kwargs={})
+        self.assertIsInstance(pair.c, DepB)
+
+    def test_missing_kwargs(self):
+        with self.assertRaises(RuntimeError) as cm:
+            self.Pair(b_kwargs={})
+        self.assertEqual(
+            str(cm.exception),
+            "During instantiation of PairBaseWired, missing kwargs for dependencies: a.",
+        )
+
+    def test_undeclared_dependency(self):
+        with self.assertRaises(RuntimeError) as cm:
+            self.Pair(a_kwargs={}, b_kwargs={}, d_kwargs={})
+        self.assertEqual(
+            str(cm.exception),
+            "Dependency 'd' not declared for class 'PairBaseWired'. "
+            "Did you forget to wire it with wire_dependencies(...) ?",
+        )
+
+    def test_invalid_kwarg_name(self):
+        with self.assertRaises(RuntimeError) as cm:
+            self.Pair(a_kwargs={}, b_kwargs={}, zz={})
+        self.assertEqual(
+            str(cm.exception),
+            "Dependency kwarg name 'zz' is invalid. Expected a name like '<dependency>_kwargs'.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()